@@ -25,31 +25,36 @@ Note: DEF density is only valid with ALL edges (copies the original slot configs
 """
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pyyaml"]
+# dependencies = []
 # ///
 
-import shutil
+import functools
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from itertools import repeat
 from pathlib import Path
-from typing import Literal
-
-import yaml
+from types import MappingProxyType
+from typing import Literal, Mapping
 
 
 # =============================================================================
 # Constants from GF180MCU PDK
 # =============================================================================
 
+# All dimensions are whole microns, so pad counts use integer arithmetic
+
 # IO cell dimensions (from LEF files)
-IO_CELL_WIDTH = 75.0  # um
-IO_CELL_HEIGHT = 350.0  # um
+IO_CELL_WIDTH = 75  # um
+IO_CELL_HEIGHT = 350  # um
 
 # Corner cell dimensions
-CORNER_CELL_SIZE = 355.0  # um (square)
+CORNER_CELL_SIZE = 355  # um (square)
 
 # Seal ring width
-SEAL_RING = 26.0  # um on each edge
+SEAL_RING = 26  # um on each edge
 
 # Core margin from die edge
 # DEF configs use 442µm (original), generated configs use more for routing space
@@ -147,6 +152,17 @@ PHYSICAL_PAD_LIMITS = {
     },
 }
 
+# Per-slot (signal_limit, power_limit) derived from the tables above.
+# Signal limit is the MAX_IO_CONFIG bidir count + 2 (clk + rst_n); power
+# limit is the number of DVDD + DVSS pads that physically fit.
+_RTL_LIMITS: dict[str, tuple[int, int]] = {
+    name: (
+        RTL_PAD_MAX_DEFAULTS[name]["bidir"] + 2,
+        PHYSICAL_PAD_LIMITS[name]["dvdd"] + PHYSICAL_PAD_LIMITS[name]["dvss"],
+    )
+    for name in RTL_PAD_MAX_DEFAULTS
+}
+
 
 # =============================================================================
 # Type Definitions
@@ -162,6 +178,11 @@ class Density(Enum):
     SPC = "spc"  # Match 1x1 spacing/layout
     NUM = "num"  # Match 1x1 pad count
 
+    @property
+    def description(self) -> str:
+        """Human-readable description of this density mode."""
+        return _DENSITY_DESCRIPTIONS[self]
+
 
 class Edges(Enum):
     """IO pad edge configurations."""
@@ -174,46 +195,80 @@ class Edges(Enum):
     SEC = "sec"  # Southeast corner (south + east)
 
     @property
-    def active_edges(self) -> set[Edge]:
+    def active_edges(self) -> frozenset[Edge]:
         """Return the set of active edges for this configuration."""
-        return {
-            Edges.ALL: {"north", "south", "east", "west"},
-            Edges.TOP: {"north"},
-            Edges.LFT: {"west"},
-            Edges.HOR: {"north", "south"},
-            Edges.VER: {"east", "west"},
-            Edges.NWC: {"north", "west"},
-            Edges.SEC: {"south", "east"},
-        }[self]
+        return _ACTIVE_EDGES[self]
 
     @property
     def description(self) -> str:
         """Human-readable description of this edge configuration."""
-        return {
-            Edges.ALL: "All four edges",
-            Edges.TOP: "Top (north) edge only",
-            Edges.LFT: "Left (west) edge only",
-            Edges.HOR: "Horizontal edges (north + south)",
-            Edges.VER: "Vertical edges (east + west)",
-            Edges.NWC: "Northwest corner (north + west)",
-            Edges.SEC: "Southeast corner (south + east)",
-        }[self]
+        return _EDGE_DESCRIPTIONS[self]
+
+    @property
+    def mask(self) -> int:
+        """Bitmask of the active edges (see EDGE_BITS)."""
+        return _EDGE_MASKS[self]
+
+
+# Density/edge lookup tables, built once rather than on every property access
+_ACTIVE_EDGES: dict[Edges, frozenset[Edge]] = {
+    Edges.ALL: frozenset({"north", "south", "east", "west"}),
+    Edges.TOP: frozenset({"north"}),
+    Edges.LFT: frozenset({"west"}),
+    Edges.HOR: frozenset({"north", "south"}),
+    Edges.VER: frozenset({"east", "west"}),
+    Edges.NWC: frozenset({"north", "west"}),
+    Edges.SEC: frozenset({"south", "east"}),
+}
+
+_DENSITY_DESCRIPTIONS: dict[Density, str] = {
+    Density.DEF: "Default density",
+    Density.MAX: "Maximum density",
+    Density.SPC: "1x1 spacing",
+    Density.NUM: "1x1 pad count",
+}
+
+_EDGE_DESCRIPTIONS: dict[Edges, str] = {
+    Edges.ALL: "All four edges",
+    Edges.TOP: "Top (north) edge only",
+    Edges.LFT: "Left (west) edge only",
+    Edges.HOR: "Horizontal edges (north + south)",
+    Edges.VER: "Vertical edges (east + west)",
+    Edges.NWC: "Northwest corner (north + west)",
+    Edges.SEC: "Southeast corner (south + east)",
+}
+
+# One bit per edge, so edge membership is a single bitwise AND
+EDGE_BITS: dict[Edge, int] = {
+    "north": 0b0001,
+    "south": 0b0010,
+    "east": 0b0100,
+    "west": 0b1000,
+}
+
+# Position of each edge in the fixed-size per-edge count lists
+_EDGE_IDX: dict[Edge, int] = {"north": 0, "south": 1, "east": 2, "west": 3}
+
+_EDGE_MASKS: dict[Edges, int] = {
+    e: sum(EDGE_BITS[edge] for edge in active) for e, active in _ACTIVE_EDGES.items()
+}
+
+# Active edges in alphabetical order, for deterministic proportional splits
+_SORTED_EDGES: dict[Edges, tuple[Edge, ...]] = {
+    e: tuple(sorted(active)) for e, active in _ACTIVE_EDGES.items()
+}
 
 
 # =============================================================================
 # Slot Definitions
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlotDefinition:
     """Definition of a slot's physical dimensions."""
     name: str
-    die_width: int  # um
-    die_height: int  # um
-    core_x1: int  # um
-    core_y1: int  # um
-    core_x2: int  # um
-    core_y2: int  # um
+    die: tuple[int, int]  # (width, height) um
+    core: tuple[int, int, int, int]  # (x1, y1, x2, y2) um
     verilog_define: str
 
 
@@ -221,42 +276,26 @@ class SlotDefinition:
 SLOTS = {
     "1x1": SlotDefinition(
         name="1x1",
-        die_width=3932,
-        die_height=5122,
-        core_x1=442,
-        core_y1=442,
-        core_x2=3490,
-        core_y2=4680,
+        die=(3932, 5122),
+        core=(442, 442, 3490, 4680),
         verilog_define="SLOT_1X1",
     ),
     "0p5x1": SlotDefinition(
         name="0p5x1",
-        die_width=1936,
-        die_height=5122,
-        core_x1=442,
-        core_y1=442,
-        core_x2=1494,
-        core_y2=4680,
+        die=(1936, 5122),
+        core=(442, 442, 1494, 4680),
         verilog_define="SLOT_0P5X1",
     ),
     "1x0p5": SlotDefinition(
         name="1x0p5",
-        die_width=3932,
-        die_height=2531,
-        core_x1=442,
-        core_y1=442,
-        core_x2=3490,
-        core_y2=2089,
+        die=(3932, 2531),
+        core=(442, 442, 3490, 2089),
         verilog_define="SLOT_1X0P5",
     ),
     "0p5x0p5": SlotDefinition(
         name="0p5x0p5",
-        die_width=1936,
-        die_height=2531,
-        core_x1=442,
-        core_y1=442,
-        core_x2=1494,
-        core_y2=2089,
+        die=(1936, 2531),
+        core=(442, 442, 1494, 2089),
         verilog_define="SLOT_0P5X0P5",
     ),
 }
@@ -266,9 +305,13 @@ SLOTS = {
 # Pad Calculation Functions
 # =============================================================================
 
-def calculate_max_pads_per_edge(slot: SlotDefinition) -> dict[str, int]:
+@functools.cache
+def calculate_max_pads_per_edge(slot: SlotDefinition) -> Mapping[str, int]:
     """Calculate maximum number of pads that can fit on each edge.
 
+    The result is cached per slot and returned as a read-only mapping, since
+    every caller shares the same object.
+
     North/South edges: (die_width - 2*corner - 2*seal_ring) / io_width
     East/West edges: (die_height - 2*corner - 2*seal_ring) / io_width
 
@@ -276,29 +319,69 @@ def calculate_max_pads_per_edge(slot: SlotDefinition) -> dict[str, int]:
     The seal ring (26um on each end) must be subtracted to match
     OpenROAD's padring generator constraints.
     """
-    ns_available = slot.die_width - 2 * CORNER_CELL_SIZE - 2 * SEAL_RING
-    ew_available = slot.die_height - 2 * CORNER_CELL_SIZE - 2 * SEAL_RING
-
-    return {
-        "north": int(ns_available / IO_CELL_WIDTH),
-        "south": int(ns_available / IO_CELL_WIDTH),
-        "east": int(ew_available / IO_CELL_WIDTH),
-        "west": int(ew_available / IO_CELL_WIDTH),
-    }
+    die_width, die_height = slot.die
+    ns_available = die_width - 2 * CORNER_CELL_SIZE - 2 * SEAL_RING
+    ew_available = die_height - 2 * CORNER_CELL_SIZE - 2 * SEAL_RING
 
+    # Opposite edges have the same length, so compute each count once
+    ns_pads = ns_available // IO_CELL_WIDTH
+    ew_pads = ew_available // IO_CELL_WIDTH
 
-def get_1x1_max_pads() -> dict[str, int]:
+    return MappingProxyType({
+        "north": ns_pads,
+        "south": ns_pads,
+        "east": ew_pads,
+        "west": ew_pads,
+    })
+
+
+@functools.cache
+def get_1x1_max_pads() -> Mapping[str, int]:
     """Get maximum pads per edge for 1x1 slot (reference for spacing)."""
     return calculate_max_pads_per_edge(SLOTS["1x1"])
 
 
+def _distribute_proportional(
+    target_total: int,
+    max_pads: Mapping[str, int],
+    edge_list: tuple[Edge, ...],
+) -> dict[str, int]:
+    """Distribute a pad count across edges in proportion to their capacity.
+
+    Every edge but the last gets its floored share; the last edge takes the
+    remainder. All counts are capped at the edge's capacity, and the target
+    is capped at the total capacity of the edges.
+    """
+    total_capacity = sum(max_pads[e] for e in edge_list)
+
+    # Don't exceed what we can actually fit
+    target_total = min(target_total, total_capacity)
+
+    pads_per_edge = {}
+    remaining = target_total
+    *leading, last = edge_list
+
+    for e in leading:
+        edge_count = target_total * max_pads[e] // total_capacity
+        pads_per_edge[e] = min(edge_count, max_pads[e])
+        remaining -= pads_per_edge[e]
+
+    # Last edge gets remainder, but still capped at max
+    pads_per_edge[last] = min(remaining, max_pads[last])
+    return pads_per_edge
+
+
+@functools.cache
 def calculate_pads_for_density(
     slot: SlotDefinition,
     density: Density,
     edges: Edges,
-) -> tuple[int, dict[str, int]]:
+) -> tuple[int, Mapping[str, int]]:
     """Calculate total pads and per-edge distribution for a given density mode.
 
+    Results are cached per (slot, density, edges), so the per-edge mapping
+    is returned read-only.
+
     Args:
         slot: Slot definition
         density: Density mode (def, max, spc, num)
@@ -308,31 +391,13 @@ def calculate_pads_for_density(
         Tuple of (total_pads, pads_per_edge_dict)
     """
     max_pads = calculate_max_pads_per_edge(slot)
-    ref_1x1_max = get_1x1_max_pads()
     active = edges.active_edges
 
     if density == Density.DEF:
         # Use default pad count for this slot, distributed across active edges
-        target_total = DEFAULT_PAD_COUNTS[slot.name]
-        total_capacity = sum(max_pads[e] for e in active)
-
-        # Don't exceed what we can actually fit
-        target_total = min(target_total, total_capacity)
-
-        # Distribute proportionally based on edge capacity
-        pads_per_edge = {}
-        remaining = target_total
-        edge_list = sorted(active)
-
-        for i, e in enumerate(edge_list):
-            if i == len(edge_list) - 1:
-                # Last edge gets remainder, but still capped at max
-                pads_per_edge[e] = min(remaining, max_pads[e])
-            else:
-                ratio = max_pads[e] / total_capacity
-                edge_count = int(target_total * ratio)
-                pads_per_edge[e] = min(edge_count, max_pads[e])
-                remaining -= pads_per_edge[e]
+        pads_per_edge = _distribute_proportional(
+            DEFAULT_PAD_COUNTS[slot.name], max_pads, _SORTED_EDGES[edges]
+        )
 
     elif density == Density.MAX:
         # Use maximum pads that fit on each active edge
@@ -340,53 +405,17 @@ def calculate_pads_for_density(
 
     elif density == Density.SPC:
         # Match 1x1 spacing - use 1x1 max counts but limited by slot size
-        pads_per_edge = {}
-        for e in active:
-            pads_per_edge[e] = min(max_pads[e], ref_1x1_max[e])
+        ref_1x1_max = get_1x1_max_pads()
+        pads_per_edge = {e: min(max_pads[e], ref_1x1_max[e]) for e in active}
 
     elif density == Density.NUM:
         # Match 1x1 total pad count, distributed across active edges
-        # Scale the reference count proportionally across active edges
-        total_ref = REF_1X1_PAD_COUNT
-        total_capacity = sum(max_pads[e] for e in active)
-
-        # Don't exceed what we can actually fit
-        target_total = min(total_ref, total_capacity)
-
-        # Distribute proportionally based on edge capacity
-        pads_per_edge = {}
-        remaining = target_total
-        edge_list = sorted(active)  # Consistent ordering
-
-        for i, e in enumerate(edge_list):
-            if i == len(edge_list) - 1:
-                # Last edge gets remainder, but still capped at max
-                pads_per_edge[e] = min(remaining, max_pads[e])
-            else:
-                # Proportional distribution
-                ratio = max_pads[e] / total_capacity
-                edge_count = int(target_total * ratio)
-                pads_per_edge[e] = min(edge_count, max_pads[e])
-                remaining -= pads_per_edge[e]
+        pads_per_edge = _distribute_proportional(
+            REF_1X1_PAD_COUNT, max_pads, _SORTED_EDGES[edges]
+        )
 
     total = sum(pads_per_edge.values())
-    return total, pads_per_edge
-
-
-def get_rtl_signal_limit(slot_name: str) -> int:
-    """Get the maximum number of signal pads the RTL supports with MAX_IO_CONFIG.
-
-    This is bidir + 2 (clk + rst_n). We don't count input/analog
-    since our generated configs use bidir for all signal pads.
-    """
-    limits = RTL_PAD_MAX_DEFAULTS[slot_name]
-    return limits["bidir"] + 2  # +2 for clk and rst_n
-
-
-def get_rtl_power_limit(slot_name: str) -> int:
-    """Get the maximum number of power pads that physically fit on this slot."""
-    limits = PHYSICAL_PAD_LIMITS[slot_name]
-    return limits["dvdd"] + limits["dvss"]
+    return total, MappingProxyType(pads_per_edge)
 
 
 def is_config_valid_for_rtl(slot_name: str, total_signal: int, total_power: int) -> bool:
@@ -394,8 +423,7 @@ def is_config_valid_for_rtl(slot_name: str, total_signal: int, total_power: int)
 
     The RTL has fixed pad counts. Generated configs cannot exceed these.
     """
-    signal_limit = get_rtl_signal_limit(slot_name)
-    power_limit = get_rtl_power_limit(slot_name)
+    signal_limit, power_limit = _RTL_LIMITS[slot_name]
 
     return total_signal <= signal_limit and total_power <= power_limit
 
@@ -419,23 +447,16 @@ def distribute_pads_with_power(
     available = total_pads - 2
 
     # Calculate power pads (rounded up to even number for VDD/VSS pairs)
-    power_pads = int(available * power_ratio)
-    if power_pads % 2 == 1:
-        power_pads += 1
-
-    signal_pads = available - power_pads
+    power_pads = (int(available * power_ratio) + 1) & ~1
 
     # Enforce RTL limits
-    signal_limit = get_rtl_signal_limit(slot_name)
-    power_limit = get_rtl_power_limit(slot_name)
+    signal_limit, power_limit = _RTL_LIMITS[slot_name]
 
     # Limit signal pads to RTL max (bidir count + 2 for clk/rst)
-    if signal_pads + 2 > signal_limit:
-        signal_pads = signal_limit - 2
+    signal_pads = min(available - power_pads, signal_limit - 2)
 
     # Limit power pads to RTL max
-    if power_pads > power_limit:
-        power_pads = power_limit
+    power_pads = min(power_pads, power_limit)
 
     return signal_pads, power_pads
 
@@ -444,6 +465,25 @@ def distribute_pads_with_power(
 # Pad Generation Functions
 # =============================================================================
 
+# Escaped pad instance names, formatted once and indexed by pad number.
+# Sized to the largest RTL bidir count and the largest physical power count,
+# which distribute_pads_with_power() never exceeds.
+_MAX_BIDIR_PADS = max(limits["bidir"] for limits in RTL_PAD_MAX_DEFAULTS.values())
+_MAX_POWER_PADS = max(limits["dvdd"] + limits["dvss"] for limits in PHYSICAL_PAD_LIMITS.values())
+_BIDIR_NAMES = tuple(f'bidir\\\\[{i}\\\\].pad' for i in range(_MAX_BIDIR_PADS))
+_DVDD_NAMES = tuple(f'dvdd_pads\\\\[{i}\\\\].pad' for i in range(_MAX_POWER_PADS))
+_DVSS_NAMES = tuple(f'dvss_pads\\\\[{i}\\\\].pad' for i in range(_MAX_POWER_PADS))
+
+# Pad kinds in a placement plan; each indexes its name table in _PAD_NAMES
+PAD_BIDIR, PAD_DVDD, PAD_DVSS, PAD_CLK, PAD_RST_N = range(5)
+_PAD_NAMES = (_BIDIR_NAMES, _DVDD_NAMES, _DVSS_NAMES, ("clk_pad",), ("rst_n_pad",))
+
+
+def pad_names(kinds: array, idxs: array) -> list[str]:
+    """Turn a placement plan from generate_edge_pads() into pad instance names."""
+    return [_PAD_NAMES[kind][idx] for kind, idx in zip(kinds, idxs)]
+
+
 def generate_edge_pads(
     edge_pad_count: int,
     signal_count: int,
@@ -453,8 +493,12 @@ def generate_edge_pads(
     vss_start: int,
     include_clk_rst: bool = False,
     reverse: bool = False,
-) -> tuple[list[str], int, int, int]:
-    """Generate pads for a single edge with interspersed power.
+) -> tuple[array, array, int, int, int]:
+    """Plan the pads for a single edge with interspersed power.
+
+    The plan is kept as two parallel integer arrays, the pad kind
+    (PAD_BIDIR, PAD_DVDD, ...) and its index, so no strings are built until
+    pad_names() is called.
 
     Args:
         edge_pad_count: Number of pads to place on this edge
@@ -467,81 +511,104 @@ def generate_edge_pads(
         reverse: Whether to reverse the pad order
 
     Returns:
-        Tuple of (pad_list, next_bidir, next_vdd, next_vss)
+        Tuple of (pad_kinds, pad_indices, next_bidir, next_vdd, next_vss)
     """
-    pads = []
+    kinds = array("B")
+    idxs = array("H")
 
     # Add clk/rst if requested
     if include_clk_rst:
-        pads.extend(["clk_pad", "rst_n_pad"])
+        kinds.extend((PAD_CLK, PAD_RST_N))
+        idxs.extend((0, 0))
         signal_count -= 2  # These take 2 signal pad slots
 
-    # Distribute power pads evenly among signal pads
+    bidir_idx = bidir_start
+    vdd_idx = vdd_start
+    vss_idx = vss_start
+
+    # Distribute power pads evenly among signal pads: each power pad follows
+    # a run of signals_per_power signals, and the leftover signals go last
     if power_count > 0 and signal_count > 0:
         signals_per_power = signal_count // (power_count + 1)
 
-        bidir_idx = bidir_start
-        vdd_idx = vdd_start
-        vss_idx = vss_start
-
         # Use global power count for alternation (continues across edges)
         global_power_idx = vdd_start + vss_start
-        power_placed = 0
-        signal_placed = 0
-
-        while signal_placed < signal_count or power_placed < power_count:
-            # Place some signal pads
-            for _ in range(min(signals_per_power, signal_count - signal_placed)):
-                pads.append(f'bidir\\\\[{bidir_idx}\\\\].pad')
-                bidir_idx += 1
-                signal_placed += 1
-
-            # Place a power pad - alternate DVSS/DVDD using global counter
-            if power_placed < power_count:
-                if global_power_idx % 2 == 0:
-                    pads.append(f'dvss_pads\\\\[{vss_idx}\\\\].pad')
-                    vss_idx += 1
-                else:
-                    pads.append(f'dvdd_pads\\\\[{vdd_idx}\\\\].pad')
-                    vdd_idx += 1
-                global_power_idx += 1
-                power_placed += 1
-
-        # Place remaining signals
-        while signal_placed < signal_count:
-            pads.append(f'bidir\\\\[{bidir_idx}\\\\].pad')
-            bidir_idx += 1
-            signal_placed += 1
-    else:
-        # No power pads, just signals
-        bidir_idx = bidir_start
-        vdd_idx = vdd_start
-        vss_idx = vss_start
+        for power_idx in range(global_power_idx, global_power_idx + power_count):
+            kinds.extend(repeat(PAD_BIDIR, signals_per_power))
+            idxs.extend(range(bidir_idx, bidir_idx + signals_per_power))
+            bidir_idx += signals_per_power
+
+            # Alternate DVSS/DVDD
+            if power_idx % 2 == 0:
+                kinds.append(PAD_DVSS)
+                idxs.append(vss_idx)
+                vss_idx += 1
+            else:
+                kinds.append(PAD_DVDD)
+                idxs.append(vdd_idx)
+                vdd_idx += 1
 
-        for _ in range(signal_count):
-            pads.append(f'bidir\\\\[{bidir_idx}\\\\].pad')
-            bidir_idx += 1
+    # Place remaining signals (all of them if this edge has no power pads)
+    run = max(signal_count - (bidir_idx - bidir_start), 0)
+    kinds.extend(repeat(PAD_BIDIR, run))
+    idxs.extend(range(bidir_idx, bidir_idx + run))
+    bidir_idx += run
 
     if reverse:
         # Keep clk/rst at start if present, reverse the rest
-        if include_clk_rst:
-            pads = pads[:2] + list(reversed(pads[2:]))
-        else:
-            pads = list(reversed(pads))
+        head = 2 if include_clk_rst else 0
+        kinds[head:] = kinds[head:][::-1]
+        idxs[head:] = idxs[head:][::-1]
 
-    return pads, bidir_idx, vdd_idx, vss_idx
+    return kinds, idxs, bidir_idx, vdd_idx, vss_idx
 
 
 # =============================================================================
 # YAML Generation
 # =============================================================================
 
+# Pad names written as plain YAML scalars; every other pad name contains
+# escaped brackets and is double-quoted
+_BARE_PAD_NAMES = frozenset({"clk_pad", "rst_n_pad"})
+
+
+def yaml_pad_scalar(pad: str) -> str:
+    """Render a pad instance name as a YAML scalar for the PAD_* lists."""
+    return pad if pad in _BARE_PAD_NAMES else f'"{pad}"'
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """Write content to path unless the file already holds exactly that.
+
+    Leaving unchanged files alone keeps their mtimes stable for re-runs.
+    The content is already encoded, so it goes straight to the file
+    descriptor without Python's buffered I/O layer.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # os.write may write less than it was given, so keep going
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
 def generate_config_yaml(
     slot: SlotDefinition,
     density: Density,
     edges: Edges,
     output_dir: Path,
-) -> Path:
+) -> tuple[Path, int]:
     """Generate a YAML configuration file for a slot/density/edges combination.
 
     Args:
@@ -551,20 +618,29 @@ def generate_config_yaml(
         output_dir: Directory to write the YAML file
 
     Returns:
-        Path to the generated file
+        Tuple of (path to the generated file, total_pads)
     """
-    active_edges = edges.active_edges
+    # Edge membership is tested for margins, clk/rst placement and pad
+    # emission, so resolve it once per config
+    mask = edges.mask
+    has_north = bool(mask & EDGE_BITS["north"])
+    has_south = bool(mask & EDGE_BITS["south"])
+    has_east = bool(mask & EDGE_BITS["east"])
+    has_west = bool(mask & EDGE_BITS["west"])
+    die_width, die_height = slot.die
+    rtl_defaults = RTL_PAD_MAX_DEFAULTS[slot.name]
     total_pads, pads_per_edge = calculate_pads_for_density(slot, density, edges)
     signal_pads, power_pads = distribute_pads_with_power(total_pads, slot.name)
 
     # Distribute signal and power pads across edges
     # signal_pads is bidir-only count; total signal positions include clk/rst (+2)
-    edge_signal = {}
-    edge_power = {}
+    # Per-edge counts are lists indexed by _EDGE_IDX
+    edge_signal = [0] * 4
+    edge_power = [0] * 4
+    edge_spare = [0] * 4
 
     # Total signal positions = bidir + 2 for clk/rst
     total_signal_positions = signal_pads + 2
-    total_to_distribute = total_signal_positions + power_pads
 
     # We must respect both:
     # 1. Per-edge physical limits (pads_per_edge[e])
@@ -573,13 +649,13 @@ def generate_config_yaml(
     signal_remaining = total_signal_positions
     power_remaining = power_pads
 
-    # Sort edges by size (larger edges first) for more even distribution
-    sorted_edges = sorted(active_edges, key=lambda e: pads_per_edge[e], reverse=True)
+    # Sort edges by size (larger edges first) for more even distribution.
+    # Starting from the precomputed alphabetical tuple makes ties deterministic.
+    sorted_edges = sorted(_SORTED_EDGES[edges], key=pads_per_edge.__getitem__, reverse=True)
+    sorted_slots = [(_EDGE_IDX[e], pads_per_edge[e]) for e in sorted_edges]
 
     # First pass: distribute based on ratio, respecting per-edge limits
-    for e in active_edges:
-        edge_capacity = pads_per_edge[e]
-
+    for i, edge_capacity in sorted_slots:
         # Calculate this edge's share based on its proportion of total capacity
         ratio = edge_capacity / total_pads if total_pads > 0 else 0
 
@@ -589,48 +665,35 @@ def generate_config_yaml(
         remaining_capacity = edge_capacity - edge_sig
         edge_pow = min(int(power_pads * ratio), power_remaining, remaining_capacity)
 
-        edge_signal[e] = edge_sig
-        edge_power[e] = edge_pow
+        edge_signal[i] = edge_sig
+        edge_power[i] = edge_pow
+        edge_spare[i] = remaining_capacity - edge_pow
         signal_remaining -= edge_sig
         power_remaining -= edge_pow
 
-    # Second pass: distribute remaining signal pads (from integer truncation)
-    for e in sorted_edges:
-        if signal_remaining <= 0:
-            break
-        available = pads_per_edge[e] - edge_signal[e] - edge_power[e]
-        if available > 0:
-            add = min(signal_remaining, available)
-            edge_signal[e] += add
-            signal_remaining -= add
-
-    # Third pass: distribute remaining power pads
-    for e in sorted_edges:
-        if power_remaining <= 0:
+    # Second pass: hand out what integer truncation left over, largest edges
+    # first. Signals are placed before power on each edge; signal placement
+    # never depends on power, so this matches filling all signals first.
+    for i, _ in sorted_slots:
+        if signal_remaining <= 0 and power_remaining <= 0:
             break
-        available = pads_per_edge[e] - edge_signal[e] - edge_power[e]
-        if available > 0:
-            add = min(power_remaining, available)
-            edge_power[e] += add
-            power_remaining -= add
+        available = edge_spare[i]
 
-    # Build the YAML structure
-    # For max/spc/num configs, add MAX_IO_CONFIG define to use all-bidir RTL
-    verilog_defines = [slot.verilog_define]
-    if density != Density.DEF:
-        verilog_defines.append("MAX_IO_CONFIG")
-        # Add bidir pad count override if actual count differs from MAX_IO_CONFIG default
-        actual_bidir = signal_pads  # signal_pads is the bidir count (excludes clk/rst)
-        max_bidir_default = RTL_PAD_MAX_DEFAULTS[slot.name]["bidir"]
-        if actual_bidir != max_bidir_default:
-            verilog_defines.append(f"NUM_BIDIR_PADS_OVERRIDE={actual_bidir}")
+        add = min(signal_remaining, available)
+        edge_signal[i] += add
+        signal_remaining -= add
+        available -= add
+
+        add = min(power_remaining, available)
+        edge_power[i] += add
+        power_remaining -= add
 
+    # Build the YAML structure
     # Calculate core margins based on which edges have IO pads
     # Edges WITH IO pads use same margin as DEF config (442µm)
     # Edges WITHOUT IO pads use minimal margin (just seal ring + small buffer)
     if density == Density.DEF:
-        core_x1, core_y1 = slot.core_x1, slot.core_y1
-        core_x2, core_y2 = slot.core_x2, slot.core_y2
+        core_x1, core_y1, core_x2, core_y2 = slot.core
     else:
         # Margin for edges with IO pads - same as DEF config
         margin_with_io = CORE_MARGIN_DEFAULT
@@ -644,24 +707,23 @@ def generate_config_yaml(
         margin_no_io = CORE_MARGIN_DEFAULT  # Same as pad-edge margin (442µm)
 
         # West edge (affects core_x1)
-        west_margin = margin_with_io if "west" in active_edges else margin_no_io
+        west_margin = margin_with_io if has_west else margin_no_io
         # East edge (affects core_x2)
-        east_margin = margin_with_io if "east" in active_edges else margin_no_io
+        east_margin = margin_with_io if has_east else margin_no_io
         # South edge (affects core_y1)
-        south_margin = margin_with_io if "south" in active_edges else margin_no_io
+        south_margin = margin_with_io if has_south else margin_no_io
         # North edge (affects core_y2)
-        north_margin = margin_with_io if "north" in active_edges else margin_no_io
+        north_margin = margin_with_io if has_north else margin_no_io
 
         core_x1 = int(west_margin)
         core_y1 = int(south_margin)
-        core_x2 = int(slot.die_width - east_margin)
-        core_y2 = int(slot.die_height - north_margin)
+        core_x2 = int(die_width - east_margin)
+        core_y2 = int(die_height - north_margin)
 
     yaml_data = {
         "FP_SIZING": "absolute",
-        "DIE_AREA": [0, 0, slot.die_width, slot.die_height],
+        "DIE_AREA": [0, 0, die_width, die_height],
         "CORE_AREA": [core_x1, core_y1, core_x2, core_y2],
-        "VERILOG_DEFINES": verilog_defines,
     }
 
     # Set PDN_CFG per slot config since config.yaml is loaded second and would override
@@ -681,95 +743,102 @@ def generate_config_yaml(
     vss_idx = 0
 
     # Determine which edge gets clk/rst (prefer south, then first active)
-    clk_rst_edge = None
-    if "south" in active_edges:
-        clk_rst_edge = "south"
-    else:
-        for edge in ["west", "east", "north"]:
-            if edge in active_edges:
-                clk_rst_edge = edge
-                break
+    clk_rst_edge = next(
+        edge
+        for edge, active in (
+            ("south", has_south),
+            ("west", has_west),
+            ("east", has_east),
+            ("north", has_north),
+        )
+        if active
+    )
 
     # Generate pads for each cardinal direction
-    for direction, edge_name in [
-        ("PAD_SOUTH", "south"),
-        ("PAD_EAST", "east"),
-        ("PAD_NORTH", "north"),
-        ("PAD_WEST", "west"),
-    ]:
-        if edge_name in active_edges:
+    for direction, edge_name, active in (
+        ("PAD_SOUTH", "south", has_south),
+        ("PAD_EAST", "east", has_east),
+        ("PAD_NORTH", "north", has_north),
+        ("PAD_WEST", "west", has_west),
+    ):
+        if active:
             reverse = edge_name in ("north", "west")
-            pads, bidir_idx, vdd_idx, vss_idx = generate_edge_pads(
+            kinds, idxs, bidir_idx, vdd_idx, vss_idx = generate_edge_pads(
                 pads_per_edge[edge_name],
-                edge_signal[edge_name],
-                edge_power[edge_name],
+                edge_signal[_EDGE_IDX[edge_name]],
+                edge_power[_EDGE_IDX[edge_name]],
                 bidir_idx, vdd_idx, vss_idx,
                 include_clk_rst=(clk_rst_edge == edge_name),
                 reverse=reverse,
             )
-            yaml_data[direction] = pads
+            yaml_data[direction] = pad_names(kinds, idxs)
         else:
             yaml_data[direction] = []
 
-    # Add power pad overrides if actual counts differ from RTL MAX_IO_CONFIG defaults
+    # For max/spc/num configs, add MAX_IO_CONFIG define to use all-bidir RTL.
+    # Add pad count overrides if actual counts differ from RTL MAX_IO_CONFIG defaults
     # This is needed for sparse edge configs and configs with different power ratios
-    if density != Density.DEF:
-        rtl_limits = RTL_PAD_MAX_DEFAULTS[slot.name]
-        if vdd_idx != rtl_limits["dvdd"]:
-            yaml_data["VERILOG_DEFINES"].append(f"NUM_DVDD_PADS_OVERRIDE={vdd_idx}")
-        if vss_idx != rtl_limits["dvss"]:
-            yaml_data["VERILOG_DEFINES"].append(f"NUM_DVSS_PADS_OVERRIDE={vss_idx}")
+    # (signal_pads is the bidir count and excludes clk/rst)
+    if density == Density.DEF:
+        yaml_data["VERILOG_DEFINES"] = [slot.verilog_define]
+    else:
+        yaml_data["VERILOG_DEFINES"] = [
+            slot.verilog_define,
+            "MAX_IO_CONFIG",
+            *(
+                f"{name}_OVERRIDE={count}"
+                for name, count, default in (
+                    ("NUM_BIDIR_PADS", signal_pads, rtl_defaults["bidir"]),
+                    ("NUM_DVDD_PADS", vdd_idx, rtl_defaults["dvdd"]),
+                    ("NUM_DVSS_PADS", vss_idx, rtl_defaults["dvss"]),
+                )
+                if count != default
+            ),
+        ]
 
     # Generate filename: slot_<size>_<density>_<edges>.yaml
     filename = f"slot_{slot.name}_{density.value}_{edges.value}.yaml"
     output_path = output_dir / filename
 
     # Write YAML with comments
-    density_desc = {
-        Density.DEF: "Default density",
-        Density.MAX: "Maximum density",
-        Density.SPC: "1x1 spacing",
-        Density.NUM: "1x1 pad count",
-    }[density]
-
-    with open(output_path, "w") as f:
-        f.write(f"# {density_desc}, {edges.description}\n")
-        f.write(f"# Slot: {slot.name}, Density: {density.value}, Edges: {edges.value}\n")
-        f.write(f"# Total pads: {total_pads} (signal: {signal_pads}, power: {power_pads})\n")
-        f.write("#\n")
-        f.write("# Floorplanning\n")
-
-        f.write(f"FP_SIZING: {yaml_data['FP_SIZING']}\n")
-        f.write(f"DIE_AREA: {yaml_data['DIE_AREA']}\n")
-        f.write(f"CORE_AREA: {yaml_data['CORE_AREA']}\n")
-        f.write(f"\n")
-        f.write(f"VERILOG_DEFINES: {yaml_data['VERILOG_DEFINES']}\n")
-
-        # Write PDN settings if present (for partial padring configs)
-        if "PDN_CFG" in yaml_data:
-            f.write(f"\n")
-            f.write("# PDN configuration for partial padring\n")
-            f.write("# Custom PDN creates ring-to-pad connections only on edges with pads\n")
-            f.write(f"PDN_CFG: {yaml_data['PDN_CFG']}\n")
-
-        f.write(f"\n")
-        f.write("# Pad instances for the padring\n")
-
-        for edge in ["PAD_SOUTH", "PAD_EAST", "PAD_NORTH", "PAD_WEST"]:
-            pads = yaml_data[edge]
-            if pads:
-                f.write(f"{edge}: [\n")
-                for i, pad in enumerate(pads):
-                    comma = "," if i < len(pads) - 1 else ""
-                    if pad in ("clk_pad", "rst_n_pad"):
-                        f.write(f"    {pad}{comma}\n")
-                    else:
-                        f.write(f'    "{pad}"{comma}\n')
-                f.write("]\n\n")
-            else:
-                f.write(f"{edge}: []\n\n")
+    density_desc = density.description
+
+    # Build the whole file in memory and write it as one UTF-8 buffer
+    out: list[str] = [
+        f"# {density_desc}, {edges.description}\n"
+        f"# Slot: {slot.name}, Density: {density.value}, Edges: {edges.value}\n"
+        f"# Total pads: {total_pads} (signal: {signal_pads}, power: {power_pads})\n"
+        "#\n"
+        "# Floorplanning\n"
+        f"FP_SIZING: {yaml_data['FP_SIZING']}\n"
+        f"DIE_AREA: {yaml_data['DIE_AREA']}\n"
+        f"CORE_AREA: {yaml_data['CORE_AREA']}\n"
+        "\n"
+        f"VERILOG_DEFINES: {yaml_data['VERILOG_DEFINES']}\n"
+    ]
+
+    # Write PDN settings if present (for partial padring configs)
+    if "PDN_CFG" in yaml_data:
+        out.append(
+            "\n"
+            "# PDN configuration for partial padring\n"
+            "# Custom PDN creates ring-to-pad connections only on edges with pads\n"
+            f"PDN_CFG: {yaml_data['PDN_CFG']}\n"
+        )
+
+    out.append("\n# Pad instances for the padring\n")
+
+    for edge in ["PAD_SOUTH", "PAD_EAST", "PAD_NORTH", "PAD_WEST"]:
+        pads = yaml_data[edge]
+        if pads:
+            items = ",\n    ".join(map(yaml_pad_scalar, pads))
+            out.append(f"{edge}: [\n    {items}\n]\n\n")
+        else:
+            out.append(f"{edge}: []\n\n")
+
+    write_if_changed(output_path, "".join(out).encode())
 
-    return output_path
+    return output_path, total_pads
 
 
 # =============================================================================
@@ -791,19 +860,53 @@ def copy_default_config(slot_name: str, output_dir: Path) -> Path:
     dest = output_dir / f"slot_{slot_name}_def_all.yaml"
 
     # Copy and prepend a comment explaining this is a copy
-    with open(source, "r") as f:
-        content = f.read()
-
-    with open(dest, "w") as f:
-        f.write(f"# Default density, All four edges\n")
-        f.write(f"# Copied from slot_{slot_name}.yaml (the original default configuration)\n")
-        f.write(f"# Slot: {slot_name}, Density: def, Edges: all\n")
-        f.write(f"#\n")
-        f.write(content)
+    header = (
+        "# Default density, All four edges\n"
+        f"# Copied from slot_{slot_name}.yaml (the original default configuration)\n"
+        f"# Slot: {slot_name}, Density: def, Edges: all\n"
+        "#\n"
+    )
+    write_if_changed(dest, header.encode() + source.read_bytes())
 
     return dest
 
 
+@functools.cache
+def _valid_combos(slot_name: str) -> tuple[tuple[Density, Edges], ...]:
+    """Return the (density, edges) pairs that are generated for a slot."""
+    return tuple(
+        (density, edges)
+        for density in Density
+        for edges in Edges
+        # Skip invalid combinations for 1x1 slot:
+        # - spc (1x1 spacing) is meaningless for 1x1 itself
+        # - num (1x1 count) is equivalent to def for 1x1
+        if not (slot_name == "1x1" and density in (Density.SPC, Density.NUM))
+        # DEF density is only valid with ALL edges
+        # (it copies the original config which uses all edges)
+        and not (density == Density.DEF and edges != Edges.ALL)
+    )
+
+
+def _generate_one(
+    job: tuple[SlotDefinition, Density, Edges],
+    output_dir: Path,
+) -> tuple[Path, int | None]:
+    """Generate a single configuration file (process pool worker).
+
+    Returns:
+        Tuple of (output_path, total_pads); total_pads is None for DEF
+        configs, which are copied from the original slot file.
+    """
+    slot, density, edges = job
+
+    # For DEF + ALL, copy the original config file
+    if density == Density.DEF:
+        return copy_default_config(slot.name, output_dir), None
+
+    return generate_config_yaml(slot, density, edges, output_dir)
+
+
 def main() -> None:
     """Generate all slot configuration variants."""
     script_dir = Path(__file__).parent
@@ -817,38 +920,40 @@ def main() -> None:
     print("  Edges:   all, top, lft (left), hor (horizontal), ver (vertical), nwc (NW corner), sec (SE corner)")
     print()
 
-    generated_files = []
+    jobs = [
+        (slot, density, edges)
+        for slot_name, slot in SLOTS.items()
+        for density, edges in _valid_combos(slot_name)
+    ]
+
+    # Every job writes its own file, so they can run in parallel. map()
+    # yields results in submission order, which keeps the output stable.
+    # With a single CPU a pool is pure overhead, so run in-process instead.
+    generate = functools.partial(_generate_one, output_dir=output_dir)
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(generate, jobs, chunksize=-(-len(jobs) // workers)))
+    else:
+        results = list(map(generate, jobs))
 
-    for slot_name, slot in SLOTS.items():
-        max_pads = calculate_max_pads_per_edge(slot)
-        print(f"Slot: {slot_name}")
-        print(f"  Max pads per edge: N/S={max_pads['north']}, E/W={max_pads['east']}")
-
-        for density in Density:
-            for edges in Edges:
-                # Skip invalid combinations for 1x1 slot:
-                # - spc (1x1 spacing) is meaningless for 1x1 itself
-                # - num (1x1 count) is equivalent to def for 1x1
-                if slot_name == "1x1" and density in (Density.SPC, Density.NUM):
-                    continue
-
-                # DEF density is only valid with ALL edges
-                # (it copies the original config which uses all edges)
-                if density == Density.DEF and edges != Edges.ALL:
-                    continue
-
-                # For DEF + ALL, copy the original config file
-                if density == Density.DEF and edges == Edges.ALL:
-                    output_path = copy_default_config(slot_name, output_dir)
-                    generated_files.append(output_path)
-                    print(f"  - {density.value}_{edges.value}: (copied original) -> {output_path.name}")
-                    continue
-
-                total, _ = calculate_pads_for_density(slot, density, edges)
-                output_path = generate_config_yaml(slot, density, edges, output_dir)
-                generated_files.append(output_path)
-
-                print(f"  - {density.value}_{edges.value}: {total} pads -> {output_path.name}")
+    generated_files = []
+    config_names: set[str] = set()
+    current_slot = None
+
+    for (slot, density, edges), (output_path, total) in zip(jobs, results):
+        if slot is not current_slot:
+            current_slot = slot
+            max_pads = calculate_max_pads_per_edge(slot)
+            print(f"Slot: {slot.name}")
+            print(f"  Max pads per edge: N/S={max_pads['north']}, E/W={max_pads['east']}")
+
+        generated_files.append(output_path)
+        config_names.add(f"{slot.name}_{density.value}_{edges.value}")
+        if total is None:
+            print(f"  - {density.value}_{edges.value}: (copied original) -> {output_path.name}")
+        else:
+            print(f"  - {density.value}_{edges.value}: {total} pads -> {output_path.name}")
 
     print()
     print(f"Generated {len(generated_files)} configuration files.")
@@ -856,10 +961,7 @@ def main() -> None:
     # Print summary for CI integration
     print()
     print("Configuration names for CI matrix:")
-    config_names = sorted(set(
-        f.stem.replace("slot_", "") for f in generated_files
-    ))
-    print(f"  {config_names}")
+    print(f"  {sorted(config_names)}")
 
 
 if __name__ == "__main__":
@@ -11,31 +11,44 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import mmap
 import os
 import re
 import shutil
 import subprocess
-import sys
 import tempfile
-from dataclasses import dataclass, field
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 
 import yaml
 
+# libyaml's C loader parses several times faster than the pure-Python one
 try:
-    from PIL import Image
-    HAS_PIL = True
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# orjson is only used for the internal parse cache, where its byte output
+# doesn't matter; the published slots.json always uses the stdlib encoder
+try:
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_PIL = False
+    HAS_ORJSON = False
 
 
 # Seal ring width in microns (26µm on each side)
 SEAL_RING_UM = 26
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlotInfo:
     """Information about a slot size."""
 
@@ -154,6 +167,18 @@ SLOT_LABELS = {
     "1x0p5_3side": "1×0.5 3-side (Half Height, no south)",
 }
 
+# Display order of slot sizes (rank by name); unknown sizes sort last
+SLOT_ORDER = {
+    name: rank
+    for rank, name in enumerate(["1x1", "0p5x1", "1x0p5", "0p5x0p5", "0p5x1_3side", "1x0p5_3side"])
+}
+
+
+def sorted_slot_names(slots: dict[str, "SlotInfo"]) -> list[str]:
+    """Return slot names in display order (see SLOT_ORDER)."""
+    return sorted(slots, key=lambda name: SLOT_ORDER.get(name, 99))
+
+
 # Density mode descriptions
 DENSITY_DESCRIPTIONS = {
     "def": "Default configuration with mixed pad types (bidir, input, analog)",
@@ -317,35 +342,48 @@ def generate_block_diagram_svg(slot: "SlotInfo", size: int = 80) -> str:
     return svg
 
 
-def parse_pad_lef(lef_dir: Path) -> dict[str, tuple[float, float]]:
-    """Parse LEF files to get pad cell dimensions."""
-    pad_sizes = {}
+# Extract SIZE X BY Y. LEF files are scanned as bytes, so they are never
+# decoded; float() accepts the ASCII digits of the captured groups directly.
+LEF_SIZE_RE = re.compile(rb"SIZE\s+([\d.]+)\s+BY\s+([\d.]+)")
 
-    for lef_file in lef_dir.glob("*.lef"):
-        with open(lef_file) as f:
-            content = f.read()
 
-        # Extract SIZE X BY Y
-        match = re.search(r"SIZE\s+([\d.]+)\s+BY\s+([\d.]+)", content)
-        if match:
-            width = float(match.group(1))
-            height = float(match.group(2))
-            cell_name = lef_file.stem
-            pad_sizes[cell_name] = (width, height)
+def read_lef_size(lef_file: Path) -> tuple[float, float] | None:
+    """Return (width, height) from the first SIZE statement in a LEF file.
 
-    return pad_sizes
+    The file is memory-mapped and searched in place, so only the matched
+    numbers are copied into Python objects.
+    """
+    with open(lef_file, "rb") as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = LEF_SIZE_RE.search(mm)
+            if match is None:
+                return None
+            return float(match.group(1)), float(match.group(2))
 
 
-def validate_geometry(slots: dict[str, SlotInfo], pad_sizes: dict[str, tuple[float, float]]) -> list[str]:
-    """Validate slot dimensions against pad geometry."""
-    warnings = []
+def find_io_pad_height(lef_dir: Path) -> float | None:
+    """Return the height of the typical IO pad cell (use bi_t as reference).
 
-    # Get typical IO pad height (use bi_t as reference)
-    io_pad_height = None
-    for name, (w, h) in pad_sizes.items():
-        if "bi_t" in name or "bi_24t" in name:
-            io_pad_height = h
-            break
+    Only the bidirectional pad LEFs are looked at, and scanning stops at the
+    first one with a SIZE statement.
+    """
+    for pattern in ("*bi_t*.lef", "*bi_24t*.lef"):
+        for lef_file in sorted(lef_dir.glob(pattern)):
+            size = read_lef_size(lef_file)
+            if size is not None:
+                return size[1]
+    return None
+
+
+def validate_geometry(slots: dict[str, SlotInfo], io_pad_height: float | None) -> list[str]:
+    """Validate slot dimensions against pad geometry.
+
+    io_pad_height is the IO pad cell height from find_io_pad_height().
+    """
+    warnings = []
 
     if io_pad_height is None:
         warnings.append("Could not find IO pad dimensions for validation")
@@ -376,11 +414,65 @@ REPO = os.environ.get("GITHUB_REPOSITORY", "wafer-space/gf180mcu-project-templat
 IMAGE_ARTIFACT_SUFFIX = "_image"
 THUMBNAIL_WIDTH = 400
 JPEG_QUALITY = 85
+# Same value as create_thumbnail.py, so both thumbnail paths resample alike
+REDUCING_GAP = 2.0
+MAX_DOWNLOAD_WORKERS = 8
+
+
+def make_thumbnail(image_path: Path, thumb_path: Path) -> None:
+    """Write a JPEG thumbnail of an image, shrunk to at most THUMBNAIL_WIDTH wide."""
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+        # thumbnail() keeps the aspect ratio and never enlarges, so bounding
+        # the height by the current height lets the width set the scale. It
+        # uses JPEG draft mode and a cheap integer reduce before LANCZOS.
+        img.thumbnail((THUMBNAIL_WIDTH, img.height), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+        img.save(thumb_path, "JPEG", quality=JPEG_QUALITY, optimize=True)
+
+
+def fetch_artifact_images(
+    artifact_name: str, run_id: str, images_dir: Path, thumbnails_dir: Path
+) -> list[tuple[Path, Path]]:
+    """Download one image artifact and store its PNGs in images_dir.
+
+    Each call uses its own temporary directory, so calls can run concurrently.
+
+    Returns:
+        List of (image_path, thumbnail_path) pairs still to be thumbnailed
+    """
+    slot_name = artifact_name.replace(IMAGE_ARTIFACT_SUFFIX, "")
+    print(f"  Downloading {slot_name}...")
+
+    thumbnail_jobs = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        subprocess.run(
+            ["gh", "run", "download", run_id, "-R", REPO, "-n", artifact_name, "-D", tmp_dir],
+            check=True, capture_output=True
+        )
+
+        for png_file in Path(tmp_dir).glob("*.png"):
+            variant = "black" if "black" in png_file.name.lower() else "white"
+            new_name = f"{slot_name}_{variant}.png"
+
+            # Copy full image
+            final_path = images_dir / new_name
+            shutil.move(str(png_file), str(final_path))
+
+            thumbnail_jobs.append((final_path, thumbnails_dir / f"{slot_name}_{variant}.jpg"))
+
+    return thumbnail_jobs
 
 
 def download_images(output_dir: Path) -> bool:
     """Download slot images from latest GitHub Actions run."""
-    if not HAS_PIL:
+    # Pillow is only needed for thumbnails, so don't pay for importing it on
+    # every run; make_thumbnail() imports it for use
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
         print("Warning: Pillow not installed, skipping image download")
         return False
 
@@ -411,36 +503,35 @@ def download_images(output_dir: Path) -> bool:
         )
         artifacts = [a for a in result.stdout.strip().split("\n") if a.endswith(IMAGE_ARTIFACT_SUFFIX)]
 
-        for artifact_name in artifacts:
-            slot_name = artifact_name.replace(IMAGE_ARTIFACT_SUFFIX, "")
-            print(f"  Downloading {slot_name}...")
-
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                subprocess.run(
-                    ["gh", "run", "download", run_id, "-R", REPO, "-n", artifact_name, "-D", tmp_dir],
-                    check=True, capture_output=True
-                )
-
-                for png_file in Path(tmp_dir).glob("*.png"):
-                    variant = "black" if "black" in png_file.name.lower() else "white"
-                    new_name = f"{slot_name}_{variant}.png"
-
-                    # Copy full image
-                    final_path = images_dir / new_name
-                    shutil.move(str(png_file), str(final_path))
-
-                    # Create thumbnail
-                    thumb_path = thumbnails_dir / f"{slot_name}_{variant}.jpg"
-                    with Image.open(final_path) as img:
-                        if img.mode in ("RGBA", "P"):
-                            img = img.convert("RGB")
-                        width, height = img.size
-                        if width > THUMBNAIL_WIDTH:
-                            ratio = THUMBNAIL_WIDTH / width
-                            img = img.resize((THUMBNAIL_WIDTH, int(height * ratio)), Image.Resampling.LANCZOS)
-                        img.save(thumb_path, "JPEG", quality=JPEG_QUALITY, optimize=True)
-
-        return True
+        # Downloads are network-bound, so fetch the artifacts concurrently
+        # and create the thumbnails once they have all landed. A failed
+        # download doesn't stop the others from getting their thumbnails.
+        failed = []
+        if artifacts:
+            thumbnail_jobs = []
+            with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(artifacts))) as executor:
+                futures = {
+                    executor.submit(fetch_artifact_images, artifact, run_id, images_dir, thumbnails_dir): artifact
+                    for artifact in artifacts
+                }
+                for future in as_completed(futures):
+                    try:
+                        thumbnail_jobs.extend(future.result())
+                    except subprocess.CalledProcessError as e:
+                        print(f"Error downloading {futures[future]}: {e}")
+                        failed.append(futures[future])
+
+            # Thumbnailing is CPU-bound, so spread it over processes. With a
+            # single CPU a pool is pure overhead, so run in-process instead.
+            workers = min(os.cpu_count() or 1, len(thumbnail_jobs))
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(make_thumbnail, *zip(*thumbnail_jobs)))
+            else:
+                for image_path, thumb_path in thumbnail_jobs:
+                    make_thumbnail(image_path, thumb_path)
+
+        return not failed
 
     except subprocess.CalledProcessError as e:
         print(f"Error downloading images: {e}")
@@ -450,14 +541,145 @@ def download_images(output_dir: Path) -> bool:
         return False
 
 
-def parse_slot_yaml(yaml_path: Path) -> SlotInfo:
+# Parsed slot YAML is cached as JSON in the user's cache directory, since
+# JSON loads far faster than YAML parses. The cache describes one slots
+# directory; entries are keyed on each file's path relative to it and
+# checked against the file's mtime and size.
+SLOT_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "gf180mcu-slot-docs" / "slots_cache.json"
+)
+
+
+def load_cache_json(raw: bytes):
+    """Decode cache JSON with orjson if available, else the stdlib."""
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def write_slot_cache(cache: dict) -> None:
+    """Atomically replace the slot cache file with cache.
+
+    Nothing is written unless cache survives a JSON round trip unchanged:
+    the encoders reject some YAML values and convert others (json turns
+    non-string keys into strings, orjson writes dates as strings), and a
+    later run must not read back different data than a fresh parse would
+    give, whichever encoder is installed. Write errors are ignored.
+    """
+    try:
+        if HAS_ORJSON:
+            raw = orjson.dumps(cache)
+        else:
+            raw = json.dumps(cache, separators=(",", ":")).encode()
+    except TypeError:
+        return
+    if load_cache_json(raw) != cache:
+        return
+
+    tmp_path = SLOT_CACHE_PATH.with_name(SLOT_CACHE_PATH.name + ".tmp")
+    try:
+        SLOT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, SLOT_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def list_slot_yaml(directory: Path) -> list[Path]:
+    """Return the slot_*.yaml files in directory sorted by name.
+
+    A plain prefix/suffix test over os.scandir avoids glob's pattern
+    matching; a missing directory yields an empty list.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.startswith("slot_") and entry.name.endswith(".yaml")
+            ]
+    except FileNotFoundError:
+        return []
+    names.sort()
+    return [directory / name for name in names]
+
+
+@functools.cache
+def load_slot_data(slots_dir: Path) -> dict[Path, dict]:
+    """Load every slot YAML file in slots_dir and its generated/ subdirectory.
+
+    Returns a dict mapping each file's path to its parsed contents, with
+    slots_dir's own files first, each group sorted by name. Files that
+    haven't changed are read back from the cache, which is rewritten only
+    if an entry was added, changed or dropped. A missing, corrupt or
+    unwritable cache just means parsing every file.
+    """
+    slots_key = str(slots_dir.resolve())
+    try:
+        cache = load_cache_json(SLOT_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        cache = None
+    cached = {}
+    if isinstance(cache, dict) and cache.get("slots_dir") == slots_key:
+        if isinstance(cache.get("files"), dict):
+            cached = cache["files"]
+
+    yaml_files = list_slot_yaml(slots_dir) + list_slot_yaml(slots_dir / "generated")
+
+    fresh = {}
+    results = {}
+    for yaml_file in yaml_files:
+        rel_path = yaml_file.relative_to(slots_dir).as_posix()
+        st = yaml_file.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cached.get(rel_path)
+        if isinstance(entry, dict) and entry.get("stamp") == stamp:
+            data = entry["data"]
+        else:
+            with open(yaml_file, "rb") as f:
+                data = yaml.load(f, Loader=SafeLoader)
+        fresh[rel_path] = {"stamp": stamp, "data": data}
+        results[yaml_file] = data
+
+    if fresh != cached:
+        write_slot_cache({"slots_dir": slots_key, "files": fresh})
+
+    return results
+
+
+PAD_DIRECTIONS = ("PAD_SOUTH", "PAD_EAST", "PAD_NORTH", "PAD_WEST")
+
+
+@functools.cache
+def classify_pad(pad_str: str) -> str | None:
+    """Return the IO category a pad instance counts as, or None if unrecognized.
+
+    Categories are "bidir", "inputs", "analog", "dvdd" and "dvss".
+
+    Pad names repeat across every config, so each distinct name is only
+    classified once.
+    """
+    if "bidir" in pad_str:
+        return "bidir"
+    if "inputs" in pad_str or pad_str in ("clk_pad", "rst_n_pad"):
+        return "inputs"
+    if "analog" in pad_str:
+        return "analog"
+    if "dvdd" in pad_str:
+        return "dvdd"
+    if "dvss" in pad_str:
+        return "dvss"
+    return None
+
+
+def parse_slot_yaml(yaml_path: Path, data: dict | None = None) -> SlotInfo:
     """Parse a slot YAML file and extract slot information.
 
     Supports both legacy naming (slot_1x1.yaml) and new naming
-    (slot_1x1_max_all.yaml) conventions.
+    (slot_1x1_max_all.yaml) conventions. If data is given it is used as
+    the already-loaded file contents instead of reading yaml_path.
     """
-    with open(yaml_path) as f:
-        data = yaml.safe_load(f)
+    if data is None:
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f, Loader=SafeLoader)
 
     # Extract slot name from filename
     # New format: slot_{size}_{density}_{edges}.yaml (e.g., slot_1x1_max_all.yaml)
@@ -497,29 +719,11 @@ def parse_slot_yaml(yaml_path: Path) -> SlotInfo:
     # Count IOs from pad lists. DVDD and DVSS are counted independently
     # because slot configs may have unpaired ground reference pads (e.g.
     # slot_1x1.yaml has 8 DVDD and 10 DVSS pads).
-    io_bidir = 0
-    io_inputs = 0
-    io_analog = 0
-    io_power_dvdd = 0
-    io_power_dvss = 0
-    unrecognized: list[str] = []
-
-    for direction in ["PAD_SOUTH", "PAD_EAST", "PAD_NORTH", "PAD_WEST"]:
-        pads = data.get(direction, [])
-        for pad in pads:
-            pad_str = str(pad)
-            if "bidir" in pad_str:
-                io_bidir += 1
-            elif "inputs" in pad_str or pad_str in ("clk_pad", "rst_n_pad"):
-                io_inputs += 1
-            elif "analog" in pad_str:
-                io_analog += 1
-            elif "dvdd" in pad_str:
-                io_power_dvdd += 1
-            elif "dvss" in pad_str:
-                io_power_dvss += 1
-            else:
-                unrecognized.append(pad_str)
+    pad_strs = [
+        str(pad) for pad in chain.from_iterable(data.get(direction, []) for direction in PAD_DIRECTIONS)
+    ]
+    counts = Counter(map(classify_pad, pad_strs))
+    unrecognized = [pad_str for pad_str in pad_strs if classify_pad(pad_str) is None] if counts[None] else []
 
     if unrecognized:
         print(
@@ -534,11 +738,11 @@ def parse_slot_yaml(yaml_path: Path) -> SlotInfo:
         die_height_um=die_height_um,
         core_width_um=core_width_um,
         core_height_um=core_height_um,
-        io_bidir=io_bidir,
-        io_inputs=io_inputs,
-        io_analog=io_analog,
-        io_power_dvdd=io_power_dvdd,
-        io_power_dvss=io_power_dvss,
+        io_bidir=counts["bidir"],
+        io_inputs=counts["inputs"],
+        io_analog=counts["analog"],
+        io_power_dvdd=counts["dvdd"],
+        io_power_dvss=counts["dvss"],
         density=density,
         edges=edges,
         config_name=config_name,
@@ -552,11 +756,11 @@ def load_all_slots(slots_dir: Path) -> dict[str, SlotInfo]:
     backward compatibility with existing documentation.
     """
     slots = {}
-    for yaml_file in sorted(slots_dir.glob("slot_*.yaml")):
-        # Skip generated directory files if any are in this folder
+    for yaml_file, data in load_slot_data(slots_dir).items():
+        # Skip generated directory files
         if "generated" in str(yaml_file):
             continue
-        slot = parse_slot_yaml(yaml_file)
+        slot = parse_slot_yaml(yaml_file, data)
         slots[slot.name] = slot
     return slots
 
@@ -572,8 +776,10 @@ def load_all_configs(slots_dir: Path) -> dict[str, list[SlotInfo]]:
 
     # Load generated configs
     if generated_dir.exists():
-        for yaml_file in sorted(generated_dir.glob("slot_*.yaml")):
-            slot = parse_slot_yaml(yaml_file)
+        for yaml_file, data in load_slot_data(slots_dir).items():
+            if yaml_file.parent != generated_dir:
+                continue
+            slot = parse_slot_yaml(yaml_file, data)
             if slot.name not in configs:
                 configs[slot.name] = []
             configs[slot.name].append(slot)
@@ -590,195 +796,376 @@ def load_all_configs(slots_dir: Path) -> dict[str, list[SlotInfo]]:
     return configs
 
 
+def config_to_dict(cfg: SlotInfo) -> dict:
+    """Return the JSON representation of a configuration variant."""
+    return {
+        "config_name": cfg.config_name,
+        "density": cfg.density,
+        "density_label": DENSITY_LABELS.get(cfg.density, cfg.density),
+        "edges": cfg.edges,
+        "edges_label": EDGE_LABELS.get(cfg.edges, cfg.edges),
+        "core": {
+            "width_um": cfg.core_width_um,
+            "height_um": cfg.core_height_um,
+            "area_mm2": round(cfg.core_area_mm2, 2),
+        },
+        "io": {
+            "bidir": cfg.io_bidir,
+            "inputs": cfg.io_inputs,
+            "analog": cfg.io_analog,
+            "power_dvdd": cfg.io_power_dvdd,
+            "power_dvss": cfg.io_power_dvss,
+            "power_total": cfg.io_power_total,
+            "signal_total": cfg.io_signal_total,
+            "pad_total": cfg.pad_total,
+        },
+    }
+
+
+def slot_to_dict(slot: SlotInfo, slot_configs: list[SlotInfo] | None = None) -> dict:
+    """Return the JSON representation of a slot and its configuration variants."""
+    slot_data = {
+        "label": slot.label,
+        "die": {
+            "width_um": slot.die_width_um,
+            "height_um": slot.die_height_um,
+            "width_mm": round(slot.die_width_mm, 3),
+            "height_mm": round(slot.die_height_mm, 3),
+            "area_mm2": round(slot.die_area_mm2, 2),
+        },
+        "slot": {
+            "width_um": slot.slot_width_um,
+            "height_um": slot.slot_height_um,
+            "width_mm": round(slot.slot_width_mm, 3),
+            "height_mm": round(slot.slot_height_mm, 3),
+            "area_mm2": round(slot.slot_area_mm2, 2),
+        },
+        "core": {
+            "width_um": slot.core_width_um,
+            "height_um": slot.core_height_um,
+            "width_mm": round(slot.core_width_mm, 3),
+            "height_mm": round(slot.core_height_mm, 3),
+            "area_mm2": round(slot.core_area_mm2, 2),
+        },
+        "io_overhead_pct": round(slot.io_overhead_pct, 1),
+        "io": {
+            "bidir": slot.io_bidir,
+            "inputs": slot.io_inputs,
+            "analog": slot.io_analog,
+            "power_dvdd": slot.io_power_dvdd,
+            "power_dvss": slot.io_power_dvss,
+            "power_total": slot.io_power_total,
+            "signal_total": slot.io_signal_total,
+            "pad_total": slot.pad_total,
+        },
+    }
+
+    # Add configuration variants if available
+    if slot_configs is not None:
+        slot_data["configurations"] = [config_to_dict(cfg) for cfg in slot_configs]
+
+    return slot_data
+
+
+def write_atomic(path: Path, data: str | bytes) -> None:
+    """Write data to path via a sibling temp file and rename.
+
+    Readers (and a failed run) never see a half-written file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data if isinstance(data, bytes) else data.encode("utf-8"))
+    os.replace(tmp_path, path)
+
+
 def generate_json(
     slots: dict[str, SlotInfo],
-    output_path: Path,
+    sorted_names: list[str],
+    generated_at: datetime,
     configs: dict[str, list[SlotInfo]] | None = None,
-) -> None:
-    """Generate JSON file with slot information."""
+    pretty: bool = True,
+) -> bytes:
+    """Generate the slots.json content with slot information.
+
+    With pretty=False the JSON is written without indentation or spaces
+    after separators, which is smaller and faster to encode.
+    """
+    configs = configs or {}
     data = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "slots": {},
+        "generated_at": generated_at.isoformat(),
+        # Sort by slot order: 1x1 first
+        "slots": {
+            name: slot_to_dict(slots[name], configs.get(name))
+            for name in sorted_names
+        },
         "density_options": DENSITY_DESCRIPTIONS,
         "edge_options": EDGE_DESCRIPTIONS,
     }
 
-    # Sort by slot order: 1x1 first
-    slot_order = ["1x1", "0p5x1", "1x0p5", "0p5x0p5", "0p5x1_3side", "1x0p5_3side"]
-    sorted_names = sorted(slots.keys(), key=lambda x: slot_order.index(x) if x in slot_order else 99)
+    if pretty:
+        content = json.dumps(data, indent=2)
+    else:
+        content = json.dumps(data, separators=(",", ":"))
 
-    for name in sorted_names:
-        slot = slots[name]
-        slot_data = {
-            "label": slot.label,
-            "die": {
-                "width_um": slot.die_width_um,
-                "height_um": slot.die_height_um,
-                "width_mm": round(slot.die_width_mm, 3),
-                "height_mm": round(slot.die_height_mm, 3),
-                "area_mm2": round(slot.die_area_mm2, 2),
-            },
-            "slot": {
-                "width_um": slot.slot_width_um,
-                "height_um": slot.slot_height_um,
-                "width_mm": round(slot.slot_width_mm, 3),
-                "height_mm": round(slot.slot_height_mm, 3),
-                "area_mm2": round(slot.slot_area_mm2, 2),
-            },
-            "core": {
-                "width_um": slot.core_width_um,
-                "height_um": slot.core_height_um,
-                "width_mm": round(slot.core_width_mm, 3),
-                "height_mm": round(slot.core_height_mm, 3),
-                "area_mm2": round(slot.core_area_mm2, 2),
-            },
-            "io_overhead_pct": round(slot.io_overhead_pct, 1),
-            "io": {
-                "bidir": slot.io_bidir,
-                "inputs": slot.io_inputs,
-                "analog": slot.io_analog,
-                "power_dvdd": slot.io_power_dvdd,
-                "power_dvss": slot.io_power_dvss,
-                "power_total": slot.io_power_total,
-                "signal_total": slot.io_signal_total,
-                "pad_total": slot.pad_total,
-            },
-        }
-
-        # Add configuration variants if available
-        if configs and name in configs:
-            slot_data["configurations"] = []
-            for cfg in configs[name]:
-                slot_data["configurations"].append({
-                    "config_name": cfg.config_name,
-                    "density": cfg.density,
-                    "density_label": DENSITY_LABELS.get(cfg.density, cfg.density),
-                    "edges": cfg.edges,
-                    "edges_label": EDGE_LABELS.get(cfg.edges, cfg.edges),
-                    "core": {
-                        "width_um": cfg.core_width_um,
-                        "height_um": cfg.core_height_um,
-                        "area_mm2": round(cfg.core_area_mm2, 2),
-                    },
-                    "io": {
-                        "bidir": cfg.io_bidir,
-                        "inputs": cfg.io_inputs,
-                        "analog": cfg.io_analog,
-                        "power_dvdd": cfg.io_power_dvdd,
-                        "power_dvss": cfg.io_power_dvss,
-                        "power_total": cfg.io_power_total,
-                        "signal_total": cfg.io_signal_total,
-                        "pad_total": cfg.pad_total,
-                    },
-                })
-
-        data["slots"][name] = slot_data
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
-
-    print(f"Generated: {output_path}")
-
-
-def generate_markdown(slots: dict[str, SlotInfo], output_path: Path) -> None:
-    """Generate Markdown file with slot information."""
-    lines = [
-        "# GF180MCU Slot Sizes",
-        "",
-        "This document describes the available slot sizes for wafer.space projects.",
-        "",
-        "## Understanding Slot Dimensions",
-        "",
-        "Each slot has three important size measurements:",
-        "",
-        "```",
-        "┌─────────────────────────────────────────┐",
-        "│             SEAL RING (26µm)            │",
-        "│  ┌───────────────────────────────────┐  │",
-        "│  │           IO RING                 │  │",
-        "│  │  ┌─────────────────────────────┐  │  │",
-        "│  │  │                             │  │  │",
-        "│  │  │        CORE AREA            │  │  │",
-        "│  │  │    (Your Design Area)       │  │  │",
-        "│  │  │                             │  │  │",
-        "│  │  └─────────────────────────────┘  │  │",
-        "│  │                                   │  │",
-        "│  └───────────────────────────────────┘  │",
-        "│                                         │",
-        "└─────────────────────────────────────────┘",
-        " ◄─────────── DIE SIZE ──────────────────►",
-        "   ◄────── USABLE SILICON ────────────►",
-        "      ◄────── CORE SIZE ───────────►",
-        "```",
-        "",
-        "- **Die Size**: The actual physical silicon dimensions, including all peripheral structures.",
-        "- **Usable Silicon**: Die size minus the seal ring (26µm on each edge). The seal ring protects the chip from damage during dicing.",
-        "- **Core Area**: The usable design area inside the IO ring where your logic is placed.",
-        "",
-        "## Slot Dimensions",
-        "",
-        "| Slot | Die Size | Usable Silicon | Core Area | IO Overhead |",
-        "|------|----------|-----------|-----------|-------------|",
-    ]
+    # json.dumps escapes non-ASCII by default, so the ASCII encode is exact
+    return content.encode("ascii")
+
+
+# Markdown page; the table rows and timestamp are filled in by generate_markdown
+MARKDOWN_TEMPLATE = """\
+# GF180MCU Slot Sizes
+
+This document describes the available slot sizes for wafer.space projects.
+
+## Understanding Slot Dimensions
+
+Each slot has three important size measurements:
+
+```
+┌─────────────────────────────────────────┐
+│             SEAL RING (26µm)            │
+│  ┌───────────────────────────────────┐  │
+│  │           IO RING                 │  │
+│  │  ┌─────────────────────────────┐  │  │
+│  │  │                             │  │  │
+│  │  │        CORE AREA            │  │  │
+│  │  │    (Your Design Area)       │  │  │
+│  │  │                             │  │  │
+│  │  └─────────────────────────────┘  │  │
+│  │                                   │  │
+│  └───────────────────────────────────┘  │
+│                                         │
+└─────────────────────────────────────────┘
+ ◄─────────── DIE SIZE ──────────────────►
+   ◄────── USABLE SILICON ────────────►
+      ◄────── CORE SIZE ───────────►
+```
+
+- **Die Size**: The actual physical silicon dimensions, including all peripheral structures.
+- **Usable Silicon**: Die size minus the seal ring (26µm on each edge). The seal ring protects the chip from damage during dicing.
+- **Core Area**: The usable design area inside the IO ring where your logic is placed.
+
+## Slot Dimensions
+
+| Slot | Die Size | Usable Silicon | Core Area | IO Overhead |
+|------|----------|-----------|-----------|-------------|
+{dim_rows}
+
+## IO Breakdown
+
+| Slot | Bidirectional | Inputs | Analog | Total IOs | DVDD | DVSS | Power Pads | Total Pads |
+|------|---------------|--------|--------|-----------|------|------|------------|------------|
+{io_rows}
+
+## Notes
+
+- **IO Overhead**: Percentage of die area consumed by seal ring and IO ring
+- **DVDD / DVSS**: Counts of DVDD (power) and DVSS (ground) pads. These are not always paired — a slot may have additional unpaired DVSS reference pads.
+- **Power Pads**: Total power-related pads (DVDD + DVSS).
+- **Total Pads**: Total number of pads in the padring, equal to Total IOs + Power Pads.
+
+*Generated: {generated}*
+"""
 
-    slot_order = ["1x1", "0p5x1", "1x0p5", "0p5x0p5", "0p5x1_3side", "1x0p5_3side"]
-    sorted_names = sorted(slots.keys(), key=lambda x: slot_order.index(x) if x in slot_order else 99)
 
+def generate_markdown(
+    slots: dict[str, SlotInfo], sorted_names: list[str], generated_at: datetime
+) -> str:
+    """Generate the SLOTS.md content with slot information."""
+    # Build the rows of both tables in one pass over the slots
+    dim_rows = []
+    io_rows = []
     for name in sorted_names:
         slot = slots[name]
         die_size = f"{slot.die_width_mm:.2f} × {slot.die_height_mm:.2f}mm ({slot.die_area_mm2:.2f}mm²)"
         slot_size = f"{slot.slot_width_mm:.2f} × {slot.slot_height_mm:.2f}mm ({slot.slot_area_mm2:.2f}mm²)"
         core_size = f"{slot.core_width_mm:.2f} × {slot.core_height_mm:.2f}mm ({slot.core_area_mm2:.2f}mm²)"
         overhead = f"{slot.io_overhead_pct:.0f}%"
-        lines.append(f"| {slot.label} | {die_size} | {slot_size} | {core_size} | {overhead} |")
-
-    lines.extend([
-        "",
-        "## IO Breakdown",
-        "",
-        "| Slot | Bidirectional | Inputs | Analog | Total IOs | DVDD | DVSS | Power Pads | Total Pads |",
-        "|------|---------------|--------|--------|-----------|------|------|------------|------------|",
-    ])
-
-    for name in sorted_names:
-        slot = slots[name]
-        lines.append(
+        dim_rows.append(f"| {slot.label} | {die_size} | {slot_size} | {core_size} | {overhead} |")
+        io_rows.append(
             f"| {slot.label} | {slot.io_bidir} | {slot.io_inputs} | {slot.io_analog} | "
             f"{slot.io_signal_total} | {slot.io_power_dvdd} | {slot.io_power_dvss} | "
             f"{slot.io_power_total} | {slot.pad_total} |"
         )
 
-    lines.extend([
-        "",
-        "## Notes",
-        "",
-        "- **IO Overhead**: Percentage of die area consumed by seal ring and IO ring",
-        "- **DVDD / DVSS**: Counts of DVDD (power) and DVSS (ground) pads. These are not always paired — a slot may have additional unpaired DVSS reference pads.",
-        "- **Power Pads**: Total power-related pads (DVDD + DVSS).",
-        "- **Total Pads**: Total number of pads in the padring, equal to Total IOs + Power Pads.",
-        "",
-        f"*Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}*",
-        "",
-    ])
+    return MARKDOWN_TEMPLATE.format(
+        dim_rows="\n".join(dim_rows),
+        io_rows="\n".join(io_rows),
+        generated=generated_at.strftime("%Y-%m-%d %H:%M UTC"),
+    )
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write("\n".join(lines))
 
-    print(f"Generated: {output_path}")
+# Stylesheet and modal image viewer script for index.html. They are written as
+# separate files next to it so browsers can cache them across pages.
+SLOTS_CSS = """\
+* { box-sizing: border-box; }
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    margin: 0;
+    padding: 20px;
+    background: #f5f5f5;
+    color: #333;
+}
+h1 { text-align: center; margin-bottom: 10px; }
+.subtitle { text-align: center; color: #666; margin-bottom: 30px; }
+.subtitle a { color: #0066cc; text-decoration: none; }
+.section-group {
+    max-width: 1200px;
+    margin: 0 auto 30px auto;
+}
+.section-group-title {
+    text-align: center;
+    font-size: 1.5em;
+    font-weight: bold;
+    color: #333;
+    margin-bottom: 20px;
+    padding: 10px;
+}
+.section-divider {
+    max-width: 1200px;
+    margin: 40px auto;
+    border: 0;
+    border-top: 2px solid #ddd;
+}
+.section {
+    background: white;
+    border-radius: 8px;
+    padding: 20px;
+    margin: 0 auto 20px auto;
+    max-width: 1200px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.section h2 { margin: 0 0 20px 0; text-align: center; }
+.section > p { text-align: center; color: #555; margin-bottom: 20px; }
+.section > p.left-align { text-align: left; }
+.size-diagram {
+    background: #f8f9fa;
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+    padding: 20px;
+    margin: 0 auto 20px auto;
+    max-width: 500px;
+    overflow-x: auto;
+}
+.size-diagram pre {
+    margin: 0;
+    font-family: monospace;
+    font-size: 12px;
+    line-height: 1.3;
+    white-space: pre;
+    color: #333;
+}
+.size-definitions {
+    max-width: 800px;
+    margin: 0 auto;
+    text-align: left;
+}
+.size-definitions dt {
+    font-weight: bold;
+    color: #333;
+    margin-top: 15px;
+}
+.size-definitions dd {
+    margin: 5px 0 0 0;
+    color: #555;
+    line-height: 1.5;
+}
+.slots-grid {
+    display: flex;
+    flex-wrap: wrap;
+    justify-content: center;
+    align-items: flex-start;
+    gap: 20px;
+    margin: 0 auto;
+}
+.slot-card {
+    background: #fafafa;
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+    padding: 20px;
+    flex-shrink: 0;
+}
+.slot-card h3 { margin: 0 0 8px 0; font-size: 1.15em; text-align: center; }
+.slot-card .dims { font-size: 0.9em; color: #666; margin-bottom: 15px; text-align: center; white-space: nowrap; }
+.slot-card .specs { font-size: 0.85em; }
+.slot-card .specs dt { font-weight: bold; color: #444; margin-top: 12px; }
+.slot-card .specs dd { margin: 3px 0 0 0; color: #555; }
+.slot-card img {
+    display: block;
+    margin: 15px auto;
+    border-radius: 4px;
+    cursor: pointer;
+    /* No max-width - display at natural thumbnail size for consistent scale */
+}
+.slot-card img:hover { opacity: 0.9; }
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-top: 15px;
+}
+th, td {
+    padding: 10px;
+    text-align: left;
+    border-bottom: 1px solid #e0e0e0;
+}
+th { background: #f5f5f5; font-weight: 600; }
+.download-link {
+    display: inline-block;
+    margin-top: 20px;
+    padding: 10px 20px;
+    background: #0066cc;
+    color: white;
+    text-decoration: none;
+    border-radius: 4px;
+}
+.download-link:hover { background: #0055aa; }
+.modal {
+    display: none;
+    position: fixed;
+    z-index: 1000;
+    left: 0; top: 0;
+    width: 100%; height: 100%;
+    background: rgba(0,0,0,0.9);
+}
+.modal img {
+    max-width: 95%; max-height: 95%;
+    margin: auto;
+    position: absolute;
+    top: 50%; left: 50%;
+    transform: translate(-50%, -50%);
+}
+.modal .close {
+    position: absolute;
+    top: 20px; right: 35px;
+    color: white;
+    font-size: 40px;
+    cursor: pointer;
+}
+"""
+
+MODAL_JS = """\
+function openModal(src) {
+    document.getElementById('imageModal').style.display = 'block';
+    document.getElementById('modalImage').src = src;
+}
+function closeModal() {
+    document.getElementById('imageModal').style.display = 'none';
+}
+document.addEventListener('keydown', e => { if (e.key === 'Escape') closeModal(); });
+"""
 
 
 def generate_html(
     slots: dict[str, SlotInfo],
-    output_path: Path,
+    sorted_names: list[str],
+    generated_at: datetime,
     images_dir: Path | None = None,
     configs: dict[str, list[SlotInfo]] | None = None,
-) -> None:
-    """Generate HTML file with slot information for GitHub Pages."""
-    slot_order = ["1x1", "0p5x1", "1x0p5", "0p5x0p5", "0p5x1_3side", "1x0p5_3side"]
-    sorted_names = sorted(slots.keys(), key=lambda x: slot_order.index(x) if x in slot_order else 99)
+) -> str:
+    """Generate the index.html content with slot information for GitHub Pages.
 
+    The page links to styles.css and modal.js (SLOTS_CSS and MODAL_JS),
+    which must be written alongside it.
+    """
     # Check which images exist
     def get_image_path(name: str, variant: str) -> str | None:
         if images_dir is None:
@@ -788,159 +1175,15 @@ def generate_html(
             return f"thumbnails/{name}_{variant}.jpg"
         return None
 
-    generated_time = datetime.now(timezone.utc).strftime("%d %b %Y %H:%M UTC")
+    generated_time = generated_at.strftime("%d %b %Y %H:%M UTC")
 
-    html = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>GF180MCU Slot Sizes - wafer.space</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: #f5f5f5;
-            color: #333;
-        }}
-        h1 {{ text-align: center; margin-bottom: 10px; }}
-        .subtitle {{ text-align: center; color: #666; margin-bottom: 30px; }}
-        .subtitle a {{ color: #0066cc; text-decoration: none; }}
-        .section-group {{
-            max-width: 1200px;
-            margin: 0 auto 30px auto;
-        }}
-        .section-group-title {{
-            text-align: center;
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 20px;
-            padding: 10px;
-        }}
-        .section-divider {{
-            max-width: 1200px;
-            margin: 40px auto;
-            border: 0;
-            border-top: 2px solid #ddd;
-        }}
-        .section {{
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 0 auto 20px auto;
-            max-width: 1200px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .section h2 {{ margin: 0 0 20px 0; text-align: center; }}
-        .section > p {{ text-align: center; color: #555; margin-bottom: 20px; }}
-        .section > p.left-align {{ text-align: left; }}
-        .size-diagram {{
-            background: #f8f9fa;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 0 auto 20px auto;
-            max-width: 500px;
-            overflow-x: auto;
-        }}
-        .size-diagram pre {{
-            margin: 0;
-            font-family: monospace;
-            font-size: 12px;
-            line-height: 1.3;
-            white-space: pre;
-            color: #333;
-        }}
-        .size-definitions {{
-            max-width: 800px;
-            margin: 0 auto;
-            text-align: left;
-        }}
-        .size-definitions dt {{
-            font-weight: bold;
-            color: #333;
-            margin-top: 15px;
-        }}
-        .size-definitions dd {{
-            margin: 5px 0 0 0;
-            color: #555;
-            line-height: 1.5;
-        }}
-        .slots-grid {{
-            display: flex;
-            flex-wrap: wrap;
-            justify-content: center;
-            align-items: flex-start;
-            gap: 20px;
-            margin: 0 auto;
-        }}
-        .slot-card {{
-            background: #fafafa;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            flex-shrink: 0;
-        }}
-        .slot-card h3 {{ margin: 0 0 8px 0; font-size: 1.15em; text-align: center; }}
-        .slot-card .dims {{ font-size: 0.9em; color: #666; margin-bottom: 15px; text-align: center; white-space: nowrap; }}
-        .slot-card .specs {{ font-size: 0.85em; }}
-        .slot-card .specs dt {{ font-weight: bold; color: #444; margin-top: 12px; }}
-        .slot-card .specs dd {{ margin: 3px 0 0 0; color: #555; }}
-        .slot-card img {{
-            display: block;
-            margin: 15px auto;
-            border-radius: 4px;
-            cursor: pointer;
-            /* No max-width - display at natural thumbnail size for consistent scale */
-        }}
-        .slot-card img:hover {{ opacity: 0.9; }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }}
-        th, td {{
-            padding: 10px;
-            text-align: left;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        th {{ background: #f5f5f5; font-weight: 600; }}
-        .download-link {{
-            display: inline-block;
-            margin-top: 20px;
-            padding: 10px 20px;
-            background: #0066cc;
-            color: white;
-            text-decoration: none;
-            border-radius: 4px;
-        }}
-        .download-link:hover {{ background: #0055aa; }}
-        .modal {{
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0; top: 0;
-            width: 100%; height: 100%;
-            background: rgba(0,0,0,0.9);
-        }}
-        .modal img {{
-            max-width: 95%; max-height: 95%;
-            margin: auto;
-            position: absolute;
-            top: 50%; left: 50%;
-            transform: translate(-50%, -50%);
-        }}
-        .modal .close {{
-            position: absolute;
-            top: 20px; right: 35px;
-            color: white;
-            font-size: 40px;
-            cursor: pointer;
-        }}
-    </style>
+    <link rel="stylesheet" href="styles.css">
 </head>
 <body>
     <h1>GF180MCU Slot Sizes</h1>
@@ -956,7 +1199,7 @@ def generate_html(
         <div class="section">
             <h2>Available Slots</h2>
             <div class="slots-grid">
-"""
+"""]
 
     for name in sorted_names:
         slot = slots[name]
@@ -967,7 +1210,7 @@ def generate_html(
             full_img = f"images/{name}_white.png"
             img_html = f'<img src="{img_path}" alt="{slot.label}" onclick="openModal(\'{full_img}\')">'
 
-        html += f"""            <div class="slot-card">
+        parts.append(f"""            <div class="slot-card">
                 <h3>{slot.label}</h3>
                 {img_html}
                 <dl class="specs">
@@ -987,9 +1230,9 @@ def generate_html(
                     <dd>{slot.pad_total} ({slot.io_signal_total} IO + {slot.io_power_total} power)</dd>
                 </dl>
             </div>
-"""
+""")
 
-    html += """        </div>
+    parts.append("""        </div>
         </div>
 
         <div class="section">
@@ -1013,11 +1256,11 @@ def generate_html(
                     </tr>
                 </thead>
                 <tbody>
-"""
+""")
 
     for name in sorted_names:
         slot = slots[name]
-        html += f"""                <tr>
+        parts.append(f"""                <tr>
                     <td>{slot.label}</td>
                     <td>{slot.die_width_mm:.2f} × {slot.die_height_mm:.2f}mm<br><small>({slot.die_area_mm2:.2f}mm²)</small></td>
                     <td>{slot.slot_width_mm:.2f} × {slot.slot_height_mm:.2f}mm<br><small>({slot.slot_area_mm2:.2f}mm²)</small></td>
@@ -1032,9 +1275,9 @@ def generate_html(
                     <td>{slot.io_power_total}</td>
                     <td>{slot.pad_total}</td>
                 </tr>
-"""
+""")
 
-    html += """            </tbody>
+    parts.append("""            </tbody>
             </table>
             <div style="text-align: center;">
                 <a href="slots.json" class="download-link">Download JSON</a>
@@ -1118,27 +1361,27 @@ def generate_html(
             </dl>
 
             <h3 style="margin-top: 25px;">Configuration Naming</h3>
-            <p>Configurations are named using the pattern: <code>{{slot}}_{{density}}_{{edges}}</code></p>
+            <p>Configurations are named using the pattern: <code>{slot}_{density}_{edges}</code></p>
             <p style="text-align: center; font-family: monospace; background: #f8f9fa; padding: 10px; border-radius: 4px; display: inline-block;">
                 Example: <strong>0p5x0p5_max_all</strong> = 0.5×0.5 slot, maximum pads, all edges
             </p>
         </div>
-"""
+""")
 
     # Add configuration variants section if configs are available
     if configs:
-        html += """
+        parts.append("""
         <div class="section">
             <h2>Configuration Variants</h2>
             <p>Each slot size has multiple configuration variants. Click on a slot to expand its variants. Click on images to view full size.</p>
-"""
+""")
         for name in sorted_names:
             if name not in configs:
                 continue
             slot_configs = configs[name]
             slot_label = SLOT_LABELS.get(name, name)
 
-            html += f"""
+            parts.append(f"""
         <details style="margin-bottom: 15px;">
             <summary style="cursor: pointer; font-weight: bold; padding: 10px; background: #f5f5f5; border-radius: 4px;">{slot_label} - {len(slot_configs)} configurations</summary>
             <table style="margin-top: 10px;">
@@ -1158,7 +1401,7 @@ def generate_html(
                     </tr>
                 </thead>
                 <tbody>
-"""
+""")
             for cfg in slot_configs:
                 density_label = DENSITY_LABELS.get(cfg.density, cfg.density)
                 edges_label = EDGE_LABELS.get(cfg.edges, cfg.edges)
@@ -1175,7 +1418,7 @@ def generate_html(
                 else:
                     img_cell = '<span style="color: #999;">-</span>'
 
-                html += f"""                    <tr>
+                parts.append(f"""                    <tr>
                         <td style="text-align: center;">{diagram_svg}</td>
                         <td style="text-align: center;">{img_cell}</td>
                         <td><code>{cfg.config_name}</code></td>
@@ -1188,41 +1431,67 @@ def generate_html(
                         <td>{cfg.io_power_total}</td>
                         <td>{cfg.pad_total}</td>
                     </tr>
-"""
-            html += """                </tbody>
+""")
+            parts.append("""                </tbody>
             </table>
         </details>
-"""
-        html += """        </div>
-"""
+""")
+        parts.append("""        </div>
+""")
 
     # Close the Advanced Slot Configurations section-group
-    html += """    </div>
+    parts.append("""    </div>
 
     <div id="imageModal" class="modal" onclick="closeModal()">
         <span class="close">&times;</span>
         <img id="modalImage">
     </div>
 
-    <script>
-        function openModal(src) {
-            document.getElementById('imageModal').style.display = 'block';
-            document.getElementById('modalImage').src = src;
-        }
-        function closeModal() {
-            document.getElementById('imageModal').style.display = 'none';
-        }
-        document.addEventListener('keydown', e => { if (e.key === 'Escape') closeModal(); });
-    </script>
+    <script src="modal.js"></script>
 </body>
 </html>
-"""
+""")
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(html)
+    return "".join(parts)
 
-    print(f"Generated: {output_path}")
+
+# Written to the output directory after a successful build, holding the
+# input hash and a hash of the outputs it produced; a later run with the
+# same inputs and untouched outputs leaves them alone. slot-docs.yml
+# deletes it before publishing the directory.
+BUILD_KEY_NAME = ".build_key"
+OUTPUT_FILES = ("slots.json", "SLOTS.md", "index.html", "styles.css", "modal.js")
+
+
+def compute_build_key(slots_dir: Path, output_dir: Path, compact_json: bool) -> str:
+    """Return a hash of everything the generated outputs depend on.
+
+    That is this script, the output options, the contents of every slot
+    YAML file, and the names and mtimes of the downloaded thumbnails.
+    """
+    key = hashlib.blake2b(digest_size=16)
+    key.update(Path(__file__).read_bytes())
+    key.update(b"compact" if compact_json else b"pretty")
+    for yaml_dir in (slots_dir, slots_dir / "generated"):
+        for yaml_file in list_slot_yaml(yaml_dir):
+            key.update(f"\0{yaml_dir.name}/{yaml_file.name}\0".encode())
+            key.update(yaml_file.read_bytes())
+    thumbnails_dir = output_dir / "thumbnails"
+    if thumbnails_dir.is_dir():
+        for thumb in sorted(thumbnails_dir.glob("*.jpg")):
+            key.update(f"\0{thumb.name}:{thumb.stat().st_mtime_ns}".encode())
+    return key.hexdigest()
+
+
+def hash_outputs(output_dir: Path) -> str | None:
+    """Return a hash of the generated output files, or None if any is missing."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in OUTPUT_FILES:
+        try:
+            digest.update((output_dir / name).read_bytes())
+        except FileNotFoundError:
+            return None
+    return digest.hexdigest()
 
 
 def main():
@@ -1241,6 +1510,16 @@ def main():
         default=None,
         help="Directory containing slot YAML files (default: librelane/slots)",
     )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write slots.json without indentation",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate outputs even if their inputs are unchanged",
+    )
     parser.add_argument(
         "--download-images",
         action="store_true",
@@ -1258,6 +1537,25 @@ def main():
         print(f"Error: Slots directory not found: {slots_dir}")
         return 1
 
+    # Download images if requested; they feed into the build key below
+    if args.download_images:
+        print("Downloading images from GitHub Actions...")
+        if download_images(output_dir):
+            print("Images downloaded successfully")
+        else:
+            print("Image download failed or skipped")
+
+    build_key = compute_build_key(slots_dir, output_dir, args.compact_json)
+    build_key_path = output_dir / BUILD_KEY_NAME
+    if not args.force:
+        try:
+            stored_key, stored_outputs = build_key_path.read_text().split()
+        except (OSError, ValueError):
+            stored_key = stored_outputs = None
+        if stored_key == build_key and stored_outputs == hash_outputs(output_dir):
+            print(f"Outputs in {output_dir} are up to date, nothing to do")
+            return 0
+
     # Load and generate
     print(f"Loading slots from: {slots_dir}")
     slots = load_all_slots(slots_dir)
@@ -1278,8 +1576,7 @@ def main():
     pdk_io_dir = script_dir / "gf180mcu" / "gf180mcuD" / "libs.ref" / "gf180mcu_fd_io" / "lef"
     if pdk_io_dir.exists():
         print(f"Validating against pad geometry from: {pdk_io_dir}")
-        pad_sizes = parse_pad_lef(pdk_io_dir)
-        warnings = validate_geometry(slots, pad_sizes)
+        warnings = validate_geometry(slots, find_io_pad_height(pdk_io_dir))
         for warning in warnings:
             print(f"  WARNING: {warning}")
         if not warnings:
@@ -1287,18 +1584,27 @@ def main():
     else:
         print("Note: PDK not found, skipping geometry validation")
 
-    # Download images if requested
-    if args.download_images:
-        print("Downloading images from GitHub Actions...")
-        if download_images(output_dir):
-            print("Images downloaded successfully")
-        else:
-            print("Image download failed or skipped")
-
-    # Generate outputs
-    generate_json(slots, output_dir / "slots.json", configs=configs)
-    generate_markdown(slots, output_dir / "SLOTS.md")
-    generate_html(slots, output_dir / "index.html", images_dir=output_dir, configs=configs)
+    # Generate outputs; each file is replaced atomically so a failed run
+    # never leaves a half-written page behind
+    # All three share one slot order and one timestamp for this run
+    sorted_names = sorted_slot_names(slots)
+    generated_at = datetime.now(timezone.utc)
+    outputs = {
+        "slots.json": generate_json(
+            slots, sorted_names, generated_at, configs=configs, pretty=not args.compact_json
+        ),
+        "SLOTS.md": generate_markdown(slots, sorted_names, generated_at),
+        "index.html": generate_html(
+            slots, sorted_names, generated_at, images_dir=output_dir, configs=configs
+        ),
+        "styles.css": SLOTS_CSS,
+        "modal.js": MODAL_JS,
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in outputs.items():
+        write_atomic(output_dir / name, content)
+        print(f"Generated: {output_dir / name}")
+    write_atomic(build_key_path, f"{build_key} {hash_outputs(output_dir)}\n")
 
     print(f"\nAll outputs written to: {output_dir}")
     return 0